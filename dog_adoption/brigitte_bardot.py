@@ -1,9 +1,13 @@
-from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+# Detail links on listing cards point at chien_a_adopter.php?id=...
+DETAIL_LINK_SELECTOR = "a[href*='chien_a_adopter.php']"
+# Content containers on detail pages, first match in document order wins
+DESCRIPTION_SELECTOR = ".post-content, .content, .entry, #content, .main-page"
+
 
 class BrigitteBardotMixin:
     def scrape_brigitte_bardot(self) -> List[Dict]:
@@ -69,7 +73,7 @@ class BrigitteBardotMixin:
                 "name": "Unknown",
                 "detail_url": "",
                 "full_description": "",
-                "scraped_date": datetime.now().isoformat(),
+                "scraped_date": self._run_timestamp,
                 "source": "fondationbrigittebardot.fr",
             }
 
@@ -129,13 +133,9 @@ class BrigitteBardotMixin:
 
             # Detail link if present
             # Prefer the specific detail link that contains "chien_a_adopter.php"
-            link = None
-            for a in element.find_all("a", href=True):
-                if "chien_a_adopter.php" in a["href"]:
-                    link = a
-                    break
-            if not link:
-                link = element.find("a", href=True)
+            link = element.select_one(DETAIL_LINK_SELECTOR) or element.find(
+                "a", href=True
+            )
             if link:
                 href = link["href"]
                 if href.startswith("http"):
@@ -175,20 +175,10 @@ class BrigitteBardotMixin:
                         full_text = meta_desc.get("content").strip()
                     else:
                         # Try to find a main description block
-                        selectors = [
-                            ".post-content",
-                            ".content",
-                            ".entry",
-                            "#content",
-                            ".main-page",
-                        ]
-                        full_text = ""
-                        for sel in selectors:
-                            node = detail_soup.select_one(sel)
-                            if node:
-                                txt = node.get_text(separator="\n", strip=True)
-                                if txt and len(txt) > len(full_text):
-                                    full_text = txt
+                        node = detail_soup.select_one(DESCRIPTION_SELECTOR)
+                        full_text = (
+                            node.get_text(separator="\n", strip=True) if node else ""
+                        )
                         if not full_text:
                             full_text = detail_soup.get_text(separator="\n", strip=True)
 
@@ -0,0 +1,285 @@
+import os
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+# Minimal headless Chrome: no GPU, extensions, background services or images
+CHROME_ARGUMENTS = [
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--metrics-recording-only",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Content settings backing up the flags: no images, no notification prompts
+CHROME_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# Resources never needed to extract listings from the rendered HTML. CSS
+# stays allowed: lazy loaders trigger on layout, which scrolling relies on.
+BLOCKED_URL_PATTERNS = [
+    "*.jpg",
+    "*.jpeg",
+    "*.png",
+    "*.webp",
+    "*.avif",
+    "*.gif",
+    "*.svg",
+    "*.ico",
+    "*.woff*",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    "*.webm",
+    "*.mp3",
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*doubleclick*",
+    "*facebook.net*",
+]
+
+# Runs the whole scroll loop in the page. Resource timing only lists finished
+# requests, so scrolling ends once 1.5s (three ticks) pass with no new
+# fetch/XHR and no page growth, or once a 15s time budget is spent.
+SCROLL_UNTIL_STABLE_JS = """
+const done = arguments[arguments.length - 1];
+performance.setResourceTimingBufferSize(10000);
+const xhrCount = () =>
+  performance
+    .getEntriesByType("resource")
+    .filter((e) => e.initiatorType === "fetch" || e.initiatorType === "xmlhttprequest")
+    .length;
+const deadline = performance.now() + 15000;
+let lastCount = xhrCount(), lastHeight = document.body.scrollHeight, idleTicks = 0;
+const tick = () => {
+  const count = xhrCount(), height = document.body.scrollHeight;
+  idleTicks = count === lastCount && height === lastHeight ? idleTicks + 1 : 0;
+  if (idleTicks >= 3 || performance.now() > deadline) {
+    return done(null);
+  }
+  lastCount = count;
+  lastHeight = height;
+  window.scrollTo(0, height);
+  setTimeout(tick, 500);
+};
+window.scrollTo(0, lastHeight);
+setTimeout(tick, 500);
+"""
+
+# Filters links in the page so only matching hrefs cross the CDP boundary
+MATCHING_LINKS_JS = """
+const patterns = arguments[0];
+return Array.from(document.querySelectorAll("a[href]"), (a) => a.href).filter(
+  (href) => patterns.some((p) => href.includes(p))
+);
+"""
+
+
+class BrowserPool:
+    """Keep warm Chrome drivers so repeated renders skip browser startup.
+
+    Each live driver owns a slot number, handed to the factory so drivers
+    can keep per-slot state (such as a profile directory) on disk.
+    """
+
+    def __init__(self, factory: Callable[[int], Any], max_size: int = 3):
+        self._factory = factory
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._free_slots: queue.Queue = queue.Queue()
+        for slot in range(max_size):
+            self._free_slots.put(slot)
+        self._slot_of: Dict[int, int] = {}
+        self._checkouts = threading.BoundedSemaphore(max_size)
+
+    def acquire(self):
+        self._checkouts.acquire()
+        try:
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    return self._start()
+                if self._is_alive(driver):
+                    return driver
+                self._quit(driver)
+        except Exception:
+            self._checkouts.release()
+            raise
+
+    def release(self, driver) -> None:
+        try:
+            # Drop the page like closing a browser context: no idle page scripts
+            driver.get("about:blank")
+            driver.delete_all_cookies()
+            self._idle.put(driver)
+        except Exception:
+            self._quit(driver)
+        finally:
+            self._checkouts.release()
+
+    def close(self) -> None:
+        """Quit idle drivers; the pool starts new ones on the next acquire."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._quit(driver)
+
+    def _start(self):
+        slot = self._free_slots.get_nowait()
+        try:
+            driver = self._factory(slot)
+        except Exception:
+            self._free_slots.put(slot)
+            raise
+        self._slot_of[id(driver)] = slot
+        return driver
+
+    def _quit(self, driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        self._free_slots.put(self._slot_of.pop(id(driver)))
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+
+class BrowserMixin:
+    def get_page_with_selenium(self, url: str) -> str:
+        """Render a page using Selenium and return its source."""
+        return self._render_with_selenium(url)
+
+    def get_page_html(self, url: str, marker: str) -> str:
+        """Fetch url over plain HTTP, rendering it only if marker is missing."""
+        try:
+            html = self.get_revalidated_html(url)
+            if marker in html:
+                return html
+        except requests.RequestException as e:
+            self.logger.warning(f"Plain fetch failed for {url}: {e}")
+        return self.get_page_with_selenium(url)
+
+    def get_links_with_selenium(
+        self, url: str, patterns: List[str], wait_for: Optional[str] = None
+    ) -> List[str]:
+        """Render a page and return only the hrefs containing one of patterns.
+
+        When given, the wait_for CSS selector must appear before scrolling starts.
+        """
+        links = self.evaluate_with_selenium(
+            url, MATCHING_LINKS_JS, list(patterns), wait_for=wait_for
+        )
+        return links or []
+
+    def evaluate_with_selenium(
+        self, url: str, script: str, *args, wait_for: Optional[str] = None
+    ) -> Any:
+        """Render a page and return what script computes in it.
+
+        Extracting in the page sends back only the values the caller needs
+        instead of the whole page source. Returns "" if rendering fails.
+        """
+        return self._render_with_selenium(
+            url, lambda d: d.execute_script(script, *args), wait_for=wait_for
+        )
+
+    def get_pages_with_selenium(self, urls: List[str]) -> List[str]:
+        """Render several pages concurrently, one pooled driver per worker."""
+        return self.map_concurrently(self.get_page_with_selenium, urls, max_workers=3)
+
+    def _create_driver(self, slot: int = 0):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+
+        # One profile per pool slot: Chrome locks a profile to a single process
+        profile_dir = os.path.abspath(
+            os.path.join(self.data_dir, "chrome-profiles", str(slot))
+        )
+        os.makedirs(profile_dir, exist_ok=True)
+        chrome_options = Options()
+        for argument in CHROME_ARGUMENTS:
+            chrome_options.add_argument(argument)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument("--disk-cache-size=104857600")
+        chrome_options.add_experimental_option("prefs", CHROME_PREFS)
+        # Return on DOMContentLoaded instead of waiting for third-party trackers
+        chrome_options.set_capability("pageLoadStrategy", "eager")
+        # Selenium Manager resolves and caches chromedriver unless a path is pinned
+        service = Service(executable_path=os.environ.get("CHROMEDRIVER_PATH"))
+        driver = webdriver.Chrome(service=service, options=chrome_options)
+        driver.set_page_load_timeout(10)
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        return driver
+
+    def _render_with_selenium(
+        self,
+        url: str,
+        extract: Callable[[Any], Any] = lambda d: d.page_source,
+        wait_for: Optional[str] = None,
+    ):
+        """Load and scroll url in a pooled driver, returning extract(driver)."""
+        try:
+            from selenium.common.exceptions import TimeoutException
+
+            driver = self.browser_pool.acquire()
+            try:
+                self.logger.info(f"Loading page with selenium: {url}")
+                try:
+                    driver.get(url)
+                except TimeoutException:
+                    driver.execute_script("window.stop();")
+                self._wait_until_loaded(driver, wait_for)
+                self._scroll_until_stable(driver)
+                return extract(driver)
+            finally:
+                self.browser_pool.release(driver)
+        except Exception as e:
+            self.logger.error(f"Selenium rendering failed for {url}: {e}")
+            return ""
+
+    def _wait_until_loaded(self, driver, wait_for: Optional[str] = None) -> None:
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        WebDriverWait(driver, 10).until(
+            lambda d: d.execute_script("return document.readyState") != "loading"
+        )
+        if wait_for:
+            try:
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, wait_for))
+                )
+            except TimeoutException:
+                self.logger.warning(f"Timed out waiting for {wait_for}")
+
+    def _scroll_until_stable(self, driver) -> None:
+        """Scroll to the bottom until lazy-loaded content stops extending the page."""
+        driver.set_script_timeout(20)
+        driver.execute_async_script(SCROLL_UNTIL_STABLE_JS)
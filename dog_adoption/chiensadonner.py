@@ -1,47 +1,63 @@
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
+from bs4 import SoupStrainer
+
+CHIENSADONNER_URL = "https://www.chiensadonner.com/"
+ILE_DE_FRANCE_DEPARTMENTS = ("75", "77", "78", "91", "92", "93", "94", "95")
+# Listing excerpts at least this long are scored without fetching the detail page
+LISTING_TEXT_MIN_LENGTH = 200
+
 
 class ChiensADonnerMixin:
     def scrape_chiensadonner(self) -> List[Dict]:
-        all_dogs: List[Dict] = []
-        base_url = "https://www.chiensadonner.com/"
-        ile_de_france_departments = ["75", "77", "78", "91", "92", "93", "94", "95"]
-        for location_code in ile_de_france_departments:
-            current_url = f"{base_url}ads/?s=&location={location_code}&scat=0&lat=0&lng=0&radius=80&st=ad_listing"
-            page_num = 1
-            while current_url and page_num <= 5:
-                self.logger.info(
-                    f"Scraping chiensadonner page {page_num} for department '{location_code}': {current_url}"
-                )
-                soup = self.get_page(current_url)
-                if not soup:
-                    self.logger.info(
-                        f"Stopping pagination for department '{location_code}' due to an error on page {page_num}."
-                    )
-                    break
-                dog_elements = soup.select("article.listing-item")
-                if not dog_elements:
-                    if page_num > 1:
-                        self.logger.info(
-                            f"No more dogs found for department '{location_code}' on page {page_num}. Stopping."
-                        )
-                    break
+        results = self.map_concurrently(
+            self._scrape_chiensadonner_department, ILE_DE_FRANCE_DEPARTMENTS
+        )
+        return [dog for dogs in results for dog in dogs]
+
+    def _scrape_chiensadonner_department(self, location_code: str) -> List[Dict]:
+        dogs: List[Dict] = []
+        current_url = f"{CHIENSADONNER_URL}ads/?s=&location={location_code}&scat=0&lat=0&lng=0&radius=80&st=ad_listing"
+        page_num = 1
+        while current_url and page_num <= 5:
+            page_dogs, current_url = self._scrape_chiensadonner_page(
+                current_url, location_code, page_num
+            )
+            dogs.extend(page_dogs)
+            page_num += 1
+        return dogs
+
+    def _scrape_chiensadonner_page(
+        self, url: str, location_code: str, page_num: int
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """Scrape one listing page; returns its dogs and the next page URL, if any."""
+        self.logger.info(
+            f"Scraping chiensadonner page {page_num} for department '{location_code}': {url}"
+        )
+        # Listing cards and the next-page link are all the loop reads
+        soup = self.get_page(url, strainer=SoupStrainer(["article", "a"]))
+        if not soup:
+            self.logger.info(
+                f"Stopping pagination for department '{location_code}' due to an error on page {page_num}."
+            )
+            return [], None
+        dog_elements = soup.select("article.listing-item")
+        if not dog_elements:
+            if page_num > 1:
                 self.logger.info(
-                    f"Found {len(dog_elements)} potential dogs on page {page_num} for department '{location_code}'"
+                    f"No more dogs found for department '{location_code}' on page {page_num}. Stopping."
                 )
-                for element in dog_elements:
-                    dog_info = self.extract_dog_info_chiensadonner(element)
-                    if dog_info:
-                        all_dogs.append(dog_info)
-                next_page_element = soup.select_one("a.next.page-numbers")
-                if next_page_element and next_page_element.get("href"):
-                    current_url = next_page_element["href"]
-                else:
-                    current_url = None
-                page_num += 1
-        return all_dogs
+            return [], None
+        self.logger.info(
+            f"Found {len(dog_elements)} potential dogs on page {page_num} for department '{location_code}'"
+        )
+        results = self.map_concurrently(
+            self.extract_dog_info_chiensadonner, dog_elements
+        )
+        next_page_element = soup.select_one("a.next.page-numbers")
+        next_url = next_page_element.get("href") if next_page_element else None
+        return [dog_info for dog_info in results if dog_info], next_url
 
     def extract_dog_info_chiensadonner(self, dog_element) -> Optional[Dict]:
         try:
@@ -49,7 +65,7 @@ class ChiensADonnerMixin:
                 "name": "Unknown",
                 "detail_url": "",
                 "full_description": "",
-                "scraped_date": datetime.now().isoformat(),
+                "scraped_date": self._run_timestamp,
                 "source": "chiensadonner.com",
             }
             title_element = dog_element.select_one("h2.entry-title a")
@@ -59,6 +75,7 @@ class ChiensADonnerMixin:
             dog_info["detail_url"] = urljoin(
                 "https://www.chiensadonner.com", title_element.get("href")
             )
+            listing_text = dog_element.get_text(separator="\n", strip=True)
             if dog_info["detail_url"]:
                 # Try cache first
                 cached_desc = self.get_cached_description(dog_info["detail_url"])
@@ -68,10 +85,13 @@ class ChiensADonnerMixin:
                         self.stats_inc("chiensadonner", True)
                     except Exception:
                         pass
+                elif len(listing_text) >= LISTING_TEXT_MIN_LENGTH:
+                    # The excerpt is enough to score; only detail pages are cached
+                    dog_info["full_description"] = listing_text
                 else:
                     detail_soup = self.get_page(dog_info["detail_url"])
                     if detail_soup:
-                        full_text = detail_soup.get_text(separator="\n", strip=True)
+                        full_text = self.extract_main_text(detail_soup)
                         dog_info["full_description"] = full_text
                         self.set_cached_description(
                             dog_info["detail_url"], full_text, name=dog_info["name"]
@@ -84,9 +104,7 @@ class ChiensADonnerMixin:
                         self.logger.warning(
                             f"Could not fetch detail page for {dog_info['name']}"
                         )
-                        dog_info["full_description"] = dog_element.get_text(
-                            separator="\n", strip=True
-                        )
+                        dog_info["full_description"] = listing_text
             return dog_info
         except Exception as e:
             self.logger.warning(
@@ -0,0 +1,66 @@
+import hashlib
+import json
+import os
+from typing import Dict, Tuple
+
+import requests
+
+
+class ConditionalCacheMixin:
+    """Keep server HTML on disk and revalidate it with conditional GETs.
+
+    The stored ETag/Last-Modified come from the same response as the body,
+    so a 304 always vouches for exactly the HTML that is reused.
+    """
+
+    def get_revalidated_html(self, url: str) -> str:
+        """GET url, reusing the stored body when the server answers 304."""
+        html_path, meta_path = self._conditional_cache_paths(url)
+        response = self.session.get(
+            url, headers=self._stored_validators(meta_path), timeout=30
+        )
+        if response.status_code == 304:
+            try:
+                with open(html_path, "r", encoding="utf-8") as f:
+                    return f.read()
+            except OSError:
+                # Body lost since the last run: fetch it again unconditionally
+                response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        self._store_html(url, response)
+        return response.text
+
+    def _conditional_cache_paths(self, url: str) -> Tuple[str, str]:
+        key = hashlib.md5(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.data_dir, "http_cache", key)
+        return base + ".html", base + ".meta.json"
+
+    def _stored_validators(self, meta_path: str) -> Dict[str, str]:
+        headers = {}
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+        except (OSError, ValueError):
+            pass
+        return headers
+
+    def _store_html(self, url: str, response: requests.Response) -> None:
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        if not meta["etag"] and not meta["last_modified"]:
+            return
+        html_path, meta_path = self._conditional_cache_paths(url)
+        try:
+            os.makedirs(os.path.dirname(html_path), exist_ok=True)
+            with open(html_path, "w", encoding="utf-8") as f:
+                f.write(response.text)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except OSError as e:
+            self.logger.warning(f"Failed to cache page {url}: {e}")
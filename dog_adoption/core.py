@@ -1,28 +1,60 @@
+import csv
 import logging
 import os
-import re
 import json
 import time
 import hashlib
 import threading
 
 # collections.defaultdict removed (unused)
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urljoin
 
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional fast JSON encoder
+    orjson = None
+
+# Descriptions are stored no longer than the Gemini prompt reads
+DESCRIPTION_MAX_LENGTH = 2000
+# Scoring prompt used when prompt.txt is missing; its hash keys cached scores
+DEFAULT_PROMPT_TEMPLATE = (
+    "Evaluate each dog's suitability for a small apartment with a "
+    "resident cat based *only* on its text below, on a scale of 0 to "
+    "100 where 100 is a perfect match.\n\n{raw_text}"
+)
+PAGE_CACHE_TTL = 600
+PAGE_CACHE_SIZE = 256
 
 
 class CoreMixin:
     def __init__(self, base_url: str = "https://www.secondechance.org"):
         self.base_url = base_url
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.session.headers.update(
             {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+                "Accept-Language": "fr-FR,fr;q=0.9",
+                "Connection": "keep-alive",
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             }
         )
         self.setup_logging()
@@ -32,10 +64,19 @@ class CoreMixin:
         self.cache_file = os.path.join(self.data_dir, "cache.json")
         self.cache_lock = threading.Lock()
         self.cache = self._load_cache()
+        # Raw page bodies by URL, so pages revisited within a run are fetched once
+        self._page_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        # Gemini prompt inputs are read once; the model is configured lazily
+        self._prompt_template = self._read_prompt_template()
+        self._prompt_hash = self._compute_prompt_hash()
+        self._gemini_model = None
+        self._gemini_lock = threading.Lock()
         # Stats for cache usage per source
         self.cache_stats = {}
-        self.search_regions = ["2", "3", "4", "5"]
-        self.paris_departments = [
+        # Shared scrape timestamp, refreshed once per run by scrape_all_sources
+        self._run_timestamp = datetime.now().isoformat()
+        self.paris_departments = (
             "41",
             "42",
             "43",
@@ -44,7 +85,7 @@ class CoreMixin:
             "46",
             "47",
             "48",
-        ]
+        )
 
     def setup_logging(self):
         log_file = "dog_bot.log"
@@ -91,16 +132,20 @@ class CoreMixin:
         except Exception as e:
             self.logger.warning(f"Failed to save cache file: {e}")
 
+    def _read_prompt_template(self) -> Optional[str]:
+        try:
+            with open("prompt.txt", "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            self.logger.error("prompt.txt not found. Using default prompt.")
+            return None
+
     def _compute_prompt_hash(self) -> str:
         try:
             with open("prompt.txt", "rb") as f:
                 content = f.read()
         except FileNotFoundError:
-            # mirror default prompt template used in _generate_gemini_prompt
-            default_template = (
-                "Evaluate the dog's suitability for apartment living with a cat based *only* on the text below.\n"
-            ).encode("utf-8")
-            content = default_template
+            content = DEFAULT_PROMPT_TEMPLATE.encode("utf-8")
         return hashlib.md5(content).hexdigest()
 
     def get_cached_description(self, detail_url: str) -> str:
@@ -113,6 +158,7 @@ class CoreMixin:
     def set_cached_description(
         self, detail_url: str, text: str, name: Optional[str] = None
     ) -> None:
+        """Store a description in memory; scrape_all_sources writes the cache."""
         if not detail_url or not text:
             return
         with self.cache_lock:
@@ -120,10 +166,12 @@ class CoreMixin:
                 "text": text,
                 "updated_at": int(time.time()),
             }
+            descriptions = self.cache.setdefault("descriptions", {})
+            # Keep the stored name when the caller does not know it
+            name = name or descriptions.get(detail_url, {}).get("name")
             if name:
                 entry["name"] = name
-            self.cache.setdefault("descriptions", {})[detail_url] = entry
-        self._save_cache()
+            descriptions[detail_url] = entry
 
     def get_cached_name(self, detail_url: str) -> str:
         if not detail_url:
@@ -132,14 +180,19 @@ class CoreMixin:
             entry = self.cache.get("descriptions", {}).get(detail_url)
             return entry.get("name", "") if entry else ""
 
-    def get_cached_score(self, detail_url: str, prompt_hash: str) -> Optional[Dict]:
+    def get_cached_score(
+        self, detail_url: str, prompt_hash: str, max_age: Optional[int] = None
+    ) -> Optional[Dict]:
         if not detail_url or not prompt_hash:
             return None
         with self.cache_lock:
             by_url = self.cache.get("scores", {}).get(detail_url)
             if not by_url:
                 return None
-            return by_url.get(prompt_hash)
+            entry = by_url.get(prompt_hash)
+        if entry and max_age and time.time() - entry.get("updated_at", 0) > max_age:
+            return None
+        return entry
 
     # ---------------
     # Cache stats utilities
@@ -150,26 +203,34 @@ class CoreMixin:
     def stats_inc(self, source: str, cached: bool) -> None:
         if not source:
             source = "unknown"
-        entry = self.cache_stats.setdefault(source, {"cached": 0, "fetched": 0})
-        if cached:
-            entry["cached"] += 1
-        else:
-            entry["fetched"] += 1
+        with self.cache_lock:
+            entry = self.cache_stats.setdefault(source, {"cached": 0, "fetched": 0})
+            if cached:
+                entry["cached"] += 1
+            else:
+                entry["fetched"] += 1
 
     def print_cache_stats(self) -> None:
         if not self.cache_stats:
             print("No cache stats available")
             return
-        print("\nCache usage per site:")
+        lines = ["\nCache usage per site:"]
         for site, counts in self.cache_stats.items():
             total = counts.get("cached", 0) + counts.get("fetched", 0)
-            print(
+            lines.append(
                 f" - {site}: total={total}, from_cache={counts.get('cached', 0)}, fetched={counts.get('fetched', 0)}"
             )
+        print("\n".join(lines))
 
     def set_cached_score(
-        self, detail_url: str, prompt_hash: str, score: int, score_details: List[str]
+        self,
+        detail_url: str,
+        prompt_hash: str,
+        score: int,
+        score_details: List[str],
+        save: bool = True,
     ) -> None:
+        """Store a score; pass save=False to batch several stores into one write."""
         if not detail_url or not prompt_hash:
             return
         with self.cache_lock:
@@ -180,164 +241,88 @@ class CoreMixin:
                 "score_details": list(score_details),
                 "updated_at": int(time.time()),
             }
-        self._save_cache()
-
-    def get_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
-        for attempt in range(retries):
-            try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, "lxml")
-            except requests.exceptions.ConnectionError as e:
-                self.logger.error(f"Connection refused for {url}: {e}")
-                return None
-            except requests.RequestException as e:
-                self.logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
-                if attempt < retries - 1:
-                    time.sleep(2**attempt)
-                else:
-                    self.logger.error(f"Failed to fetch {url} after {retries} attempts")
-                    return None
+        if save:
+            self._save_cache()
+
+    def get_page(
+        self, url: str, strainer: Optional[SoupStrainer] = None
+    ) -> Optional[BeautifulSoup]:
+        """Fetch and parse url; a strainer limits parsing to the tags it matches."""
+        content = self._fetch_page_content(url)
+        if content is None:
+            return None
+        return BeautifulSoup(content, "lxml", parse_only=strainer)
+
+    def _fetch_page_content(self, url: str) -> Optional[bytes]:
+        """GET url, serving repeats within PAGE_CACHE_TTL from memory.
+
+        The cache is FIFO: hits are not moved, so entries stay in insertion
+        (and expiry) order and the oldest is evicted first.
+        """
+        now = time.monotonic()
+        with self._page_cache_lock:
+            hit = self._page_cache.get(url)
+            if hit and hit[0] > now:
+                return hit[1]
+        # Retries with backoff are handled by the session's HTTPAdapter
+        try:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.error(f"Failed to fetch {url}: {e}")
+            return None
+        with self._page_cache_lock:
+            self._page_cache[url] = (now + PAGE_CACHE_TTL, response.content)
+            self._page_cache.move_to_end(url)
+            # Oldest insert first, so expired entries sit at the front
+            while self._page_cache and (
+                len(self._page_cache) > PAGE_CACHE_SIZE
+                or next(iter(self._page_cache.values()))[0] <= now
+            ):
+                self._page_cache.popitem(last=False)
+        return response.content
+
+    def map_concurrently(
+        self, func: Callable, items: Iterable, max_workers: int = 8
+    ) -> List:
+        """Apply func to every item on a thread pool, preserving item order."""
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
 
     def save_data(self, dogs: List[Dict]):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         json_filename = f"{self.data_dir}/dogs_{timestamp}.json"
-        with open(json_filename, "w", encoding="utf-8") as f:
-            json.dump(dogs, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(json_filename, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        dogs, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+        else:
+            with open(json_filename, "w", encoding="utf-8") as f:
+                json.dump(dogs, f, ensure_ascii=False, indent=2)
         if dogs:
             csv_filename = f"{self.data_dir}/dogs_{timestamp}.csv"
-            df = pd.DataFrame(dogs)
-            df.to_csv(csv_filename, index=False, encoding="utf-8")
+            # Columns in first-seen order across dogs, like a DataFrame export
+            fieldnames = list(dict.fromkeys(key for dog in dogs for key in dog))
+            with open(csv_filename, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(dogs)
         self.logger.info(
             f"Data saved to {json_filename} and {csv_filename if dogs else 'CSV not created (no data)'}"
         )
 
-    def _generate_gemini_prompt(
-        self, dog_info: Dict, breed_analysis: Optional[str] = None
-    ) -> str:
-        try:
-            with open("prompt.txt", "r", encoding="utf-8") as f:
-                prompt_template = f.read()
-        except FileNotFoundError:
-            self.logger.error("prompt.txt not found. Using default prompt.")
-            description = dog_info.get("full_description", "N/A")
-            description = description[:1500]
-            breed_text = ""
-            if breed_analysis:
-            breed_text = f"An AI analysis suggests the following about the breed: '{breed_analysis}'. Please take this into account."
-            return f"""
-            Evaluate the dog's suitability for apartment living with a cat based *only* on the text below.
-            Description: {description}
-            {breed_text}
-            On a scale of 0 to 100, where 100 is a perfect match, how suitable is this dog for a small apartment with a resident cat?
-            Provide only the integer score, without any extra text or explanation.
-            """
-
-        dog_name = dog_info.get("name", "Unknown")
-        description = dog_info.get("full_description", "N/A")
-        description = description[:2000]
-        if breed_analysis:
-            description += f"\n\nAdditional breed analysis: {breed_analysis}"
-        prompt = prompt_template.replace("{dog_name}", dog_name)
-        prompt = prompt.replace("{raw_text}", description)
-        return prompt
-
-    def score_dog_with_gemini(
-        self, dog_info: Dict, breed_analysis: Optional[str] = None
-    ) -> Dict:
-        try:
-            detail_url = dog_info.get("detail_url", "")
-            full_desc = dog_info.get("full_description") or self.get_cached_description(
-                detail_url
-            )
-            if full_desc:
-                # ensure cache has it for next runs
-                self.set_cached_description(detail_url, full_desc)
-            else:
-                # Try to fetch description if we have a URL
-                if detail_url:
-                    full_desc = self.get_full_description(detail_url)
-                    if full_desc:
-                        dog_info["full_description"] = full_desc
-                        self.set_cached_description(detail_url, full_desc)
-                # If still missing, skip Gemini
-                if not full_desc:
-                    self.logger.info(
-                        f"Skipping Gemini for {dog_info.get('name', 'Unknown')} due to missing description"
-                    )
-                    return {"score": -1, "score_details": ["Missing description"]}
-
-            prompt_hash = self._compute_prompt_hash()
-            cached = self.get_cached_score(detail_url, prompt_hash)
-            if cached is not None:
-                return {
-                    "score": cached["score"],
-                    "score_details": cached["score_details"],
-                }
-            # If we have a cached description but no cached score for this prompt, warn
-            try:
-                if detail_url and self.get_cached_description(detail_url):
-                    self.logger.warning(
-                        f"Cached description found for {detail_url} but no cached score for current prompt (hash={prompt_hash}). Gemini will be called."
-                    )
-            except Exception:
-                pass
-
-            result = self._call_gemini_api(dog_info, breed_analysis)
-            if isinstance(result, dict) and "score" in result:
-                self.set_cached_score(
-                    detail_url,
-                    prompt_hash,
-                    result.get("score", 0),
-                    result.get("score_details", []),
-                )
-            return result
-        except Exception as e:
-            self.logger.error(
-                f"Error scoring dog '{dog_info.get('name')}' with Gemini: {e}"
-            )
-            return {"score": -1, "score_details": ["Error scoring with Gemini"]}
-
-    def _call_gemini_api(
-        self, dog_info: Dict, breed_analysis: Optional[str] = None
-    ) -> Dict:
-        import google.generativeai as genai
-
-        api_key = os.environ.get("API_KEY")
-        if not api_key:
-            self.logger.error("API_KEY environment variable not set.")
-            return {"score": 0, "score_details": ["Missing API Key"]}
-
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel("gemini-1.5-flash")
-        prompt = self._generate_gemini_prompt(dog_info, breed_analysis)
-        if not prompt:
-            return {"score": -1, "score_details": ["Prompt generation failed"]}
-        response = model.generate_content(prompt)
-        score = self._parse_gemini_score(
-            response.text if hasattr(response, "text") else str(response)
-        )
-        dog_info["score"] = score
-        dog_info["score_details"] = [f"Gemini Score: {score}/100"]
-        return dog_info
-
-    def _parse_gemini_score(self, score_text: str) -> int:
-        score_text = score_text.strip()
-        score_match = re.search(r"\d+", score_text)
-        if score_match:
-            try:
-                return int(score_match.group())
-            except ValueError:
-                return 0
-        self.logger.warning(f"Could not parse score from Gemini response: {score_text}")
-        return 0
-
     def extract_dog_info(self, dog_element) -> Dict:
         dog_info = {
             "name": "Unknown",
             "detail_url": "",
             "full_description": "",
-            "scraped_date": datetime.now().isoformat(),
+            "scraped_date": self._run_timestamp,
         }
         try:
             name_elem = dog_element.find("h3", class_="pacifico-regular")
@@ -363,18 +348,7 @@ class CoreMixin:
             soup = self.get_page(detail_url)
             if not soup:
                 return ""
-            full_desc = ""
-            full_desc += self._extract_section_text(soup, "Présentation")
-            full_desc += self._extract_section_text(
-                soup, "Particularités", prefix="PARTICULARITÉ: "
-            )
-            if not full_desc:
-                paragraphs = soup.find_all("p")
-                for p in paragraphs:
-                    text = p.get_text().strip()
-                    if len(text) > 50:
-                        full_desc += text + "\n\n"
-            full_desc = full_desc.strip()
+            full_desc = self._extract_sections(soup)
             if full_desc:
                 self.set_cached_description(detail_url, full_desc)
             return full_desc
@@ -384,6 +358,32 @@ class CoreMixin:
             )
             return ""
 
+    def _extract_sections(self, soup) -> str:
+        """Return the Présentation/Particularités text of a detail page.
+
+        Falls back to the page's longer paragraphs; the result is capped at
+        DESCRIPTION_MAX_LENGTH, the most any prompt uses.
+        """
+        full_desc = self._extract_section_text(soup, "Présentation")
+        full_desc += self._extract_section_text(
+            soup, "Particularités", prefix="PARTICULARITÉ: "
+        )
+        if not full_desc:
+            for p in soup.find_all("p"):
+                text = p.get_text().strip()
+                if len(text) > 50:
+                    full_desc += text + "\n\n"
+        return full_desc.strip()[:DESCRIPTION_MAX_LENGTH]
+
+    def extract_main_text(self, soup) -> str:
+        """Return the text of the page's main content node, or of the whole page.
+
+        Capped at DESCRIPTION_MAX_LENGTH like _extract_sections.
+        """
+        main = soup.select_one("main, article, #content, .entry-content")
+        text = (main or soup).get_text(separator="\n", strip=True)
+        return text[:DESCRIPTION_MAX_LENGTH]
+
     def _extract_section_text(self, soup, header_text: str, prefix: str = "") -> str:
         text_accum = ""
         section = soup.find("h3", string=header_text)
@@ -399,44 +399,3 @@ class CoreMixin:
         return text_accum
 
     # Media-related scraping has been disabled per project configuration.
-
-    def get_page_with_selenium(self, url: str) -> str:
-        """Render a page using Selenium and return page source (keeps previous behavior)."""
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-            from selenium.webdriver.chrome.service import Service
-            from webdriver_manager.chrome import ChromeDriverManager
-            import time
-
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            try:
-                self.logger.info(f"Loading page with selenium: {url}")
-                driver.get(url)
-                time.sleep(3)
-                last_height = driver.execute_script("return document.body.scrollHeight")
-                scroll_count = 0
-                while True:
-                    driver.execute_script(
-                        "window.scrollTo(0, document.body.scrollHeight);"
-                    )
-                    time.sleep(2)
-                    new_height = driver.execute_script(
-                        "return document.body.scrollHeight"
-                    )
-                    if new_height == last_height or scroll_count > 10:
-                        break
-                    last_height = new_height
-                    scroll_count += 1
-                time.sleep(2)
-                return driver.page_source
-            finally:
-                driver.quit()
-        except Exception as e:
-            self.logger.error(f"Selenium rendering failed for {url}: {e}")
-            return ""
@@ -1,8 +1,11 @@
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 from bs4 import BeautifulSoup
 
+# Posts in one listing batch; fewer server-rendered links than this may mean
+# the others are lazily loaded
+LISTING_PAGE_SIZE = 12
+
 
 class CrocsMignonsMixin:
     def scrape_crocsmignons(self) -> List[Dict]:
@@ -10,32 +13,52 @@ class CrocsMignonsMixin:
         all_dogs: List[Dict] = []
         url = "https://www.latribudescrocsmignons.com/a-l-adoption"
         try:
-            page_src = self.get_page_with_selenium(url)
-            if not page_src:
-                return all_dogs
-            soup = BeautifulSoup(page_src, "lxml")
-            links = set()
-            for a in soup.find_all("a", href=True):
-                if "single-post" in a["href"]:
-                    links.add(a["href"])
+            links = self._fetch_crocsmignons_links(url)
+            if len(links) < LISTING_PAGE_SIZE:
+                # A short server-rendered listing may load the rest client-side
+                self.logger.info(
+                    f"Only {len(links)} server-rendered links, rendering the listing"
+                )
+                links.update(
+                    self.get_links_with_selenium(
+                        url, ["single-post"], wait_for="a[href*='single-post']"
+                    )
+                )
             self.logger.info(
                 f"Found {len(links)} potential dog pages from latribudescrocsmignons.com"
             )
-            for link in links:
-                dog_info = self.extract_dog_info_crocsmignons(link)
-                if dog_info:
-                    all_dogs.append(dog_info)
+            results = self.map_concurrently(self.extract_dog_info_crocsmignons, links)
+            all_dogs.extend(dog_info for dog_info in results if dog_info)
         except Exception as e:
             self.logger.error(f"Error scraping latribudescrocsmignons.com: {e}")
         return all_dogs
 
+    def _fetch_crocsmignons_links(self, url: Optional[str]) -> Set[str]:
+        """Collect post links from the server-rendered listing and its rel=next pages."""
+        links: Set[str] = set()
+        for _ in range(10):
+            soup = self.get_page(url) if url else None
+            if not soup:
+                break
+            links.update(self._extract_crocsmignons_links(soup))
+            next_link = soup.find("link", rel="next", href=True)
+            url = next_link["href"] if next_link else None
+        return links
+
+    def _extract_crocsmignons_links(self, soup: BeautifulSoup) -> Set[str]:
+        return {
+            a["href"]
+            for a in soup.find_all("a", href=True)
+            if "single-post" in a["href"]
+        }
+
     def extract_dog_info_crocsmignons(self, detail_url: str) -> Optional[Dict]:
         try:
             dog_info: Dict = {
                 "name": "Unknown",
                 "detail_url": detail_url,
                 "full_description": "",
-                "scraped_date": datetime.now().isoformat(),
+                "scraped_date": self._run_timestamp,
                 "source": "latribudescrocsmignons.com",
             }
             # Try cache first to avoid re-downloading
@@ -56,7 +79,7 @@ class CrocsMignonsMixin:
                         dog_info["name"] = (
                             title_element.get_text(strip=True).split("|")[0].strip()
                         )
-                    full_text = detail_soup.get_text(separator="\n", strip=True)
+                    full_text = self.extract_main_text(detail_soup)
                     dog_info["full_description"] = full_text
                     self.set_cached_description(
                         dog_info["detail_url"], full_text, name=dog_info["name"]
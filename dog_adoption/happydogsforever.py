@@ -1,73 +1,64 @@
-from datetime import datetime
+import re
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+# Grouped selectors: soupsieve matches every alternative in one tree walk
+DOG_ELEMENT_SELECTOR = (
+    "[class*='dog'i], [class*='pet'i], [class*='animal'i], [class*='card'i], "
+    "[class*='profile'i], article, .entry, .post, [class*='item'i]"
+)
+# Name candidates in priority order; the class-substring selectors also match
+# card wrappers, so they are only a fallback
+NAME_SELECTORS = (
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    ".name",
+    ".title",
+    ".dog-name",
+    "[class*='dog'i]",
+    "[class*='pet'i]",
+    "[class*='animal'i]",
+)
+GENERIC_NAMES = frozenset(["dog", "pet", "animal", "chien", "chat"])
+# Category links to skip: cats and already-adopted dogs
+_EXCLUDED_CATEGORY_RE = re.compile("les-chats|ils-sont-adoptes", re.IGNORECASE)
+# Cards with at least this much text are not worth a detail-page fetch
+CARD_TEXT_MIN_LENGTH = 500
+
 
 class HappyDogsForeverMixin:
     def scrape_happydogsforever(self) -> List[Dict]:
         self.logger.info("Scraping from happydogsforever.com")
         all_dogs: List[Dict] = []
+        seen_dogs = set()
         url = "https://www.happydogsforever.com/nos-chiens-chats"
         try:
-            page_src = self.get_page_with_selenium(url)
-            if not page_src:
-                return all_dogs
-            soup = BeautifulSoup(page_src, "lxml")
-            category_links: List[str] = []
-            category_selectors = [
-                "a[href*='nos-chiens-chats']",
-                "a[href*='nos-chiens-a-l-adoption']",
+            hrefs = self.get_links_with_selenium(
+                url, ["nos-chiens-chats", "nos-chiens-a-l-adoption"]
+            )
+            category_links = [
+                full_url
+                for full_url in dict.fromkeys(hrefs)
+                if not _EXCLUDED_CATEGORY_RE.search(full_url)
             ]
-            for selector in category_selectors:
-                links = soup.select(selector)
-                for link in links:
-                    href = link.get("href")
-                    if not href:
-                        continue
-                    if href.startswith("http"):
-                        full_url = href
-                    else:
-                        full_url = urljoin("https://www.happydogsforever.com", href)
-                    if (
-                        full_url not in category_links
-                        and "les-chats" not in full_url.lower()
-                        and "ils-sont-adoptes" not in full_url.lower()
-                    ):
-                        category_links.append(full_url)
-                        self.logger.info(f"Found category link: {full_url}")
+            for full_url in category_links:
+                self.logger.info(f"Found category link: {full_url}")
             self.logger.info(f"Found {len(category_links)} category links to follow")
-            for category_url in category_links:
+            category_pages = self.get_pages_with_selenium(category_links)
+            for category_url, page_src in zip(category_links, category_pages):
                 try:
                     self.logger.info(f"Scraping category: {category_url}")
-                    page_src = self.get_page_with_selenium(category_url)
                     if not page_src:
                         continue
                     category_soup = BeautifulSoup(page_src, "lxml")
-                    dog_selectors = [
-                        "[class*='dog'i]",
-                        "[class*='pet'i]",
-                        "[class*='animal'i]",
-                        "[class*='card'i]",
-                        "[class*='profile'i]",
-                        "article",
-                        ".entry",
-                        ".post",
-                        "[class*='item'i]",
-                    ]
-                    dog_elements = []
-                    for selector in dog_selectors:
-                        elements = category_soup.select(selector)
-                        if elements:
-                            dog_elements.extend(elements)
-                            self.logger.info(
-                                f"Found {len(elements)} elements with selector '{selector}' in category"
-                            )
-                    unique_dog_elements = []
-                    for element in dog_elements:
-                        if element not in unique_dog_elements:
-                            unique_dog_elements.append(element)
+                    # Each element is returned once, in document order
+                    unique_dog_elements = category_soup.select(DOG_ELEMENT_SELECTOR)
                     self.logger.info(
                         f"Found {len(unique_dog_elements)} unique potential dog elements in category"
                     )
@@ -75,16 +66,9 @@ class HappyDogsForeverMixin:
                         try:
                             dog_info = self.extract_dog_info_happydogsforever(element)
                             if dog_info and dog_info["name"] != "Unknown":
-                                is_duplicate = False
-                                for existing_dog in all_dogs:
-                                    if (
-                                        existing_dog["name"] == dog_info["name"]
-                                        and existing_dog["detail_url"]
-                                        == dog_info["detail_url"]
-                                    ):
-                                        is_duplicate = True
-                                        break
-                                if not is_duplicate:
+                                dog_key = (dog_info["name"], dog_info["detail_url"])
+                                if dog_key not in seen_dogs:
+                                    seen_dogs.add(dog_key)
                                     all_dogs.append(dog_info)
                         except Exception as e:
                             self.logger.warning(
@@ -105,43 +89,23 @@ class HappyDogsForeverMixin:
                 "name": "Unknown",
                 "detail_url": "",
                 "full_description": "",
-                "scraped_date": datetime.now().isoformat(),
+                "scraped_date": self._run_timestamp,
                 "source": "happydogsforever.com",
             }
-            name_selectors = [
-                "h1",
-                "h2",
-                "h3",
-                "h4",
-                "h5",
-                "h6",
-                ".name",
-                ".title",
-                ".dog-name",
-                "[class*='dog'i]",
-                "[class*='pet'i]",
-                "[class*='animal'i]",
-            ]
-            for selector in name_selectors:
+            for selector in NAME_SELECTORS:
                 name_elem = dog_element.select_one(selector)
-                if name_elem:
-                    name_text = name_elem.get_text(strip=True)
-                    if (
-                        name_text
-                        and len(name_text) > 1
-                        and name_text.lower()
-                        not in ["dog", "pet", "animal", "chien", "chat"]
-                    ):
-                        dog_info["name"] = name_text
-                        break
+                if not name_elem:
+                    continue
+                name_text = name_elem.get_text(strip=True)
+                if len(name_text) > 1 and name_text.lower() not in GENERIC_NAMES:
+                    dog_info["name"] = name_text
+                    break
             if dog_info["name"] == "Unknown":
                 element_text = dog_element.get_text(strip=True)
                 if element_text and len(element_text) > 1:
-                    lines = element_text.split("\n")
-                    if lines:
-                        first_line = lines[0].strip()
-                        if first_line and len(first_line) > 1:
-                            dog_info["name"] = first_line[:50]
+                    first_line = element_text.partition("\n")[0].strip()
+                    if first_line and len(first_line) > 1:
+                        dog_info["name"] = first_line[:50]
             link_elem = dog_element.find("a", href=True)
             if link_elem:
                 href = link_elem["href"]
@@ -166,7 +130,7 @@ class HappyDogsForeverMixin:
                         self.stats_inc("happydogsforever", True)
                     except Exception:
                         pass
-                else:
+                elif len(dog_info["full_description"]) < CARD_TEXT_MIN_LENGTH:
                     detail_soup = self.get_page(dog_info["detail_url"])
                     if detail_soup:
                         detail_text = detail_soup.get_text(separator="\n", strip=True)
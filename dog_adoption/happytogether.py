@@ -1,8 +1,29 @@
-from datetime import datetime
-from typing import Dict, List
+import re
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# Every field read from a topic, as one alternation scanned in a single pass
+_TOPIC_FIELDS_RE = re.compile(
+    r"(?P<breed>berger|labrador|golden|chihuahua|bouledogue|carlin|caniche"
+    r"|cavalier|retriever|husky)"
+    r"|(?P<age>\d+\s*ans?|\d+\s*mois|née?\s*en\s*\d{4})"
+    r"|\b(?:(?P<male>m[âa]les?)|(?P<female>femelles?|females?))\b"
+    r"|(?P<size>petit|moyen|grand)",
+    re.IGNORECASE,
+)
+TOPIC_TITLE_SELECTOR = "h1.page-title, h1.topic-title, h1"
+TOPIC_CONTENT_SELECTOR = ".post, .content, .post-content, .message"
+# Title and post text of a rendered topic, extracted in the browser
+TOPIC_TEXT_JS = """
+const title = document.querySelector(arguments[0]);
+const content = document.querySelector(arguments[1]);
+return {
+  title: title ? title.innerText.trim() : "",
+  text: (content || document.body).innerText.trim(),
+};
+"""
 
 
 class HappyTogetherMixin:
@@ -17,12 +38,15 @@ class HappyTogetherMixin:
         for section_name, section_path in forum_sections.items():
             self.logger.info(f"Scraping section: {section_name}")
             forum_url = urljoin(base_url, section_path)
-            topics = self.get_forum_topics_happytogether(forum_url)
-            for i, topic in enumerate(topics[:10]):
-                self.logger.info(
-                    f"Scraping topic {i + 1}/{min(10, len(topics))}: {topic['title']}"
-                )
-                dog_details = self.get_topic_details_happytogether(topic["url"])
+            topics = self.get_forum_topics_happytogether(forum_url)[:10]
+            self.logger.info(f"Scraping {len(topics)} topics in {section_name}")
+            # One worker per pooled browser, as topics may need rendering
+            details = self.map_concurrently(
+                self.get_topic_details_happytogether,
+                [topic["url"] for topic in topics],
+                max_workers=3,
+            )
+            for dog_details in details:
                 if dog_details:
                     dog_details["source"] = "happytogether.forumactif.com"
                     all_dogs.append(dog_details)
@@ -32,39 +56,37 @@ class HappyTogetherMixin:
         return all_dogs
 
     # NOTE: Do not override the selenium renderer from CoreMixin here to avoid recursion.
-    # Use CoreMixin.get_page_with_selenium directly via method resolution order.
+    # Use BrowserMixin.get_page_with_selenium directly via method resolution order.
 
     def get_forum_topics_happytogether(self, forum_url):
         try:
-            html_content = self.get_page_with_selenium(forum_url)
-            soup = BeautifulSoup(html_content, "html.parser")
-            topics: List[Dict] = []
-            topic_elements = soup.select("ul.topiclist li.row")
-            for element in topic_elements:
-                topic_link = element.select_one("a.topictitle")
-                if topic_link:
-                    topic_url = urljoin(
-                        "https://happytogether.forumactif.com", topic_link.get("href")
-                    )
-                    topic_title = topic_link.get_text().strip()
-                    last_post_elem = element.select_one(".lastpost")
-                    last_post_info = ""
-                    if last_post_elem:
-                        last_post_info = last_post_elem.get_text().strip()
-                    topics.append(
-                        {
-                            "title": topic_title,
-                            "url": topic_url,
-                            "last_post": last_post_info,
-                            "scraped_date": datetime.now().isoformat(),
-                        }
-                    )
+            html_content = self.get_page_html(forum_url, "topictitle")
+            # Only the topic list is read; the rest of the page is never built
+            soup = BeautifulSoup(html_content, "lxml", parse_only=SoupStrainer("ul"))
+            rows = soup.select("ul.topiclist li.row")
+            topics = [
+                topic for topic in map(self._parse_topic_happytogether, rows) if topic
+            ]
             self.logger.info(f"Found {len(topics)} topics in forum")
             return topics
         except Exception as e:
             self.logger.error(f"Error getting forum topics: {e}")
             return []
 
+    def _parse_topic_happytogether(self, element) -> Optional[Dict]:
+        topic_link = element.select_one("a.topictitle")
+        if not topic_link:
+            return None
+        last_post_elem = element.select_one(".lastpost")
+        return {
+            "title": topic_link.get_text().strip(),
+            "url": urljoin(
+                "https://happytogether.forumactif.com", topic_link.get("href")
+            ),
+            "last_post": last_post_elem.get_text().strip() if last_post_elem else "",
+            "scraped_date": self._run_timestamp,
+        }
+
     def get_topic_details_happytogether(self, topic_url):
         try:
             # Use cached description if available to avoid re-rendering via Selenium
@@ -74,41 +96,29 @@ class HappyTogetherMixin:
                     self.stats_inc("happytogether", True)
                 except Exception:
                     pass
-                soup = BeautifulSoup("", "html.parser")
-                title = "Unknown"
+                # The topic title is not cached; the name extracted from it is
+                name = self.get_cached_name(topic_url)
+                if not name:
+                    name = self.extract_dog_name_happytogether("Unknown", cached_desc)
                 dog_info = {
-                    "name": self.extract_dog_name_happytogether(title, cached_desc),
-                    "breed": self.extract_breed_happytogether(cached_desc),
-                    "age": self.extract_age_happytogether(cached_desc),
-                    "gender": self.extract_gender_happytogether(cached_desc),
-                    "size": self.extract_size_happytogether(cached_desc),
+                    "name": name,
+                    **self.extract_fields_happytogether(cached_desc),
                     "description": cached_desc[:1000],
                     "full_description": cached_desc,
                     "detail_url": topic_url,
-                    "scraped_date": datetime.now().isoformat(),
+                    "scraped_date": self._run_timestamp,
                 }
                 return dog_info
 
-            html_content = self.get_page_with_selenium(topic_url)
-            soup = BeautifulSoup(html_content, "html.parser")
-            title_elem = soup.select_one("h1.page-title, h1.topic-title, h1")
-            title = title_elem.get_text().strip() if title_elem else "Unknown"
-            content_area = soup.select_one(".post, .content, .post-content, .message")
-            full_description = ""
-            if content_area:
-                full_description = content_area.get_text(separator="\n", strip=True)
-            else:
-                full_description = soup.get_text(separator="\n", strip=True)
+            title, full_description = self._read_topic_happytogether(topic_url)
+            title = title or "Unknown"
             dog_info = {
                 "name": self.extract_dog_name_happytogether(title, full_description),
-                "breed": self.extract_breed_happytogether(full_description),
-                "age": self.extract_age_happytogether(full_description),
-                "gender": self.extract_gender_happytogether(full_description),
-                "size": self.extract_size_happytogether(full_description),
+                **self.extract_fields_happytogether(full_description),
                 "description": full_description[:1000],
                 "full_description": full_description,
                 "detail_url": topic_url,
-                "scraped_date": datetime.now().isoformat(),
+                "scraped_date": self._run_timestamp,
             }
             if full_description:
                 self.set_cached_description(
@@ -123,63 +133,45 @@ class HappyTogetherMixin:
             self.logger.error(f"Error getting topic details: {e}")
             return None
 
+    def _read_topic_happytogether(self, topic_url: str) -> Tuple[str, str]:
+        """Return a topic's (title, text), rendering it only if plain HTTP lacks posts."""
+        # forumactif renders topics server-side; the browser is a fallback
+        soup = self.get_page(topic_url)
+        content_area = soup.select_one(TOPIC_CONTENT_SELECTOR) if soup else None
+        if content_area:
+            title_elem = soup.select_one(TOPIC_TITLE_SELECTOR)
+            title = title_elem.get_text().strip() if title_elem else ""
+            return title, content_area.get_text(separator="\n", strip=True)
+        topic = self.evaluate_with_selenium(
+            topic_url, TOPIC_TEXT_JS, TOPIC_TITLE_SELECTOR, TOPIC_CONTENT_SELECTOR
+        )
+        if not topic:
+            return "", ""
+        return topic.get("title", ""), topic.get("text", "")
+
     def extract_dog_name_happytogether(self, title, description):
         if title and " - " in title:
             return title.split(" - ")[0].strip()
         return title or "Unknown"
 
-    def extract_breed_happytogether(self, description):
-        breed_keywords = [
-            "berger",
-            "labrador",
-            "golden",
-            "chihuahua",
-            "bouledogue",
-            "carlin",
-            "caniche",
-            "cavalier",
-            "retriever",
-            "husky",
-        ]
-        description_lower = description.lower()
-        for keyword in breed_keywords:
-            if keyword in description_lower:
-                start = description_lower.find(keyword)
-                if start > -1:
-                    end = min(start + 50, len(description))
-                    return description[start:end].strip()
-        return ""
-
-    def extract_age_happytogether(self, description):
-        import re
-
-        age_patterns = [
-            r"(\d+)\s*ans?",
-            r"(\d+)\s*mois",
-            r"né\s*en\s*(\d{4})",
-            r"née\s*en\s*(\d{4})",
-        ]
-        description_lower = description.lower()
-        for pattern in age_patterns:
-            match = re.search(pattern, description_lower)
-            if match:
-                return match.group(0)
-        return ""
-
-    def extract_gender_happytogether(self, description):
-        description_lower = description.lower()
-        if "mâle" in description_lower or "male" in description_lower:
-            return "Mâle"
-        elif "femelle" in description_lower or "femelle" in description_lower:
-            return "Femelle"
-        return ""
-
-    def extract_size_happytogether(self, description):
-        description_lower = description.lower()
-        if "petit" in description_lower:
-            return "Petit"
-        elif "moyen" in description_lower:
-            return "Moyen"
-        elif "grand" in description_lower:
-            return "Grand"
-        return ""
+    def extract_fields_happytogether(self, description: str) -> Dict[str, str]:
+        """Return the first breed, age, gender and size mentioned in description."""
+        fields = {"breed": "", "age": "", "gender": "", "size": ""}
+        missing = len(fields)
+        for match in _TOPIC_FIELDS_RE.finditer(description):
+            kind = match.lastgroup
+            if kind in ("male", "female"):
+                field, value = "gender", "Mâle" if kind == "male" else "Femelle"
+            elif kind == "breed":
+                field = kind
+                value = description[match.start() : match.start() + 50].strip()
+            elif kind == "size":
+                field, value = kind, match.group().capitalize()
+            else:
+                field, value = kind, match.group()
+            if not fields[field]:
+                fields[field] = value
+                missing -= 1
+                if not missing:
+                    break
+        return fields
@@ -1,34 +1,39 @@
 import json
-from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
+from bs4 import SoupStrainer
+
 
 class LarcheDeKalaMixin:
     def scrape_larchedekala(self) -> List[Dict]:
         self.logger.info("Scraping from larchedekala.fr")
         all_dogs: List[Dict] = []
         url = "https://www.larchedekala.fr/nos-chiens-a-l-adoption/les-chiots-jusqu-a-1-an"
-        soup = self.get_page(url)
+        # Match on the data attribute: a class_ strainer sees the raw class
+        # string at parse time and would miss multi-class containers
+        soup = self.get_page(
+            url, strainer=SoupStrainer("div", attrs={"data-webshop-product": True})
+        )
         if not soup:
             return []
         dog_elements = soup.find_all("div", class_="js-product-container")
+        detail_urls: List[str] = []
         for element in dog_elements:
             if "data-webshop-product" in element.attrs:
                 product_data = element["data-webshop-product"]
                 try:
                     dog_info_json = json.loads(product_data)
-                    detail_url = urljoin(
-                        "https://www.larchedekala.fr", dog_info_json.get("url")
+                    detail_urls.append(
+                        urljoin("https://www.larchedekala.fr", dog_info_json.get("url"))
                     )
-                    dog_info = self.extract_dog_info_larchedekala(detail_url)
-                    if dog_info:
-                        all_dogs.append(dog_info)
                 except json.JSONDecodeError:
                     self.logger.warning(
                         "Warning: Could not decode JSON for a product on larchedekala.fr."
                     )
                     continue
+        results = self.map_concurrently(self.extract_dog_info_larchedekala, detail_urls)
+        all_dogs.extend(dog_info for dog_info in results if dog_info)
         return all_dogs
 
     def extract_dog_info_larchedekala(self, detail_url: str) -> Optional[Dict]:
@@ -37,7 +42,7 @@ class LarcheDeKalaMixin:
                 "name": "Unknown",
                 "detail_url": detail_url,
                 "full_description": "",
-                "scraped_date": datetime.now().isoformat(),
+                "scraped_date": self._run_timestamp,
                 "source": "larchedekala.fr",
             }
             # Try cache first
@@ -1,12 +1,18 @@
+import asyncio
+import atexit
+import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from itertools import islice
 from typing import Dict, List
 
-import schedule
-
 # Support both package execution (python -m dog_adoption.main) and direct script
 # execution (python dog_adoption/main.py) by providing import fallbacks.
 try:  # Package context
     from .core import CoreMixin
+    from .browser import BrowserMixin, BrowserPool
+    from .conditional_cache import ConditionalCacheMixin
     from .secondechance import SecondeChanceMixin
     from .chiensadonner import ChiensADonnerMixin
     from .crocsmignons import CrocsMignonsMixin
@@ -16,12 +22,16 @@ try:  # Package context
     from .happytogether import HappyTogetherMixin
     from .brigitte_bardot import BrigitteBardotMixin
     from .reseau_adoption import ReseauAdoptionMixin
+    from .seen_index import SeenIndexMixin
+    from .scoring import BATCH_SIZE, GEMINI_CONCURRENCY, ScoringMixin
 except ImportError:  # Direct script context
     import os
     import sys
 
     sys.path.append(os.path.dirname(__file__))
     from core import CoreMixin
+    from browser import BrowserMixin, BrowserPool
+    from conditional_cache import ConditionalCacheMixin
     from secondechance import SecondeChanceMixin
     from chiensadonner import ChiensADonnerMixin
     from crocsmignons import CrocsMignonsMixin
@@ -31,10 +41,19 @@ except ImportError:  # Direct script context
     from happytogether import HappyTogetherMixin
     from brigitte_bardot import BrigitteBardotMixin
     from reseau_adoption import ReseauAdoptionMixin
+    from seen_index import SeenIndexMixin
+    from scoring import BATCH_SIZE, GEMINI_CONCURRENCY, ScoringMixin
+
+
+# Local time of the scheduled daily scrape
+DAILY_SCRAPE_HOUR = 9
 
 
 class DogAdoptionBot(
     CoreMixin,
+    BrowserMixin,
+    ConditionalCacheMixin,
+    ScoringMixin,
     SecondeChanceMixin,
     ChiensADonnerMixin,
     CrocsMignonsMixin,
@@ -44,11 +63,34 @@ class DogAdoptionBot(
     HappyTogetherMixin,
     BrigitteBardotMixin,
     ReseauAdoptionMixin,
+    SeenIndexMixin,
 ):
     def __init__(self, base_url: str = "https://www.secondechance.org"):
         CoreMixin.__init__(self, base_url=base_url)
+        self._seen_index = self.load_seen_index()
+        self.browser_pool = BrowserPool(self._create_driver)
+        # Warm drivers and pooled connections outlive a single scrape; release
+        # them on exit
+        atexit.register(self.browser_pool.close)
+        atexit.register(self.session.close)
+        # Gemini's async client binds to the loop it first runs on, so every
+        # scoring pass reuses this loop instead of a fresh asyncio.run one
+        self._scoring_loop = asyncio.new_event_loop()
+        atexit.register(self._scoring_loop.close)
+        self._scheduler_thread = None
 
     def scrape_all_sources(self) -> List[Dict]:
+        self._run_timestamp = datetime.now().isoformat()
+        all_dogs = self._scrape_sources_concurrently()
+        self._release_scrape_resources()
+        self.logger.info("Total dogs scraped from all sources: %d", len(all_dogs))
+        unique_dogs = self._deduplicate_dogs(all_dogs)
+        self._score_new_dogs(unique_dogs)
+        unique_dogs.sort(key=lambda x: x.get("score", 0), reverse=True)
+        self.logger.info("Total unique dogs from all sources: %d", len(unique_dogs))
+        return unique_dogs
+
+    def _scrape_sources_concurrently(self) -> List[Dict]:
         all_dogs: List[Dict] = []
         with ThreadPoolExecutor(max_workers=10) as executor:
             future_to_source = {
@@ -70,64 +112,92 @@ class DogAdoptionBot(
                     self.logger.info("Found %d dogs from %s", len(dogs), source)
                 except Exception as exc:
                     self.logger.error(f"{source} generated an exception: {exc}")
-        self.logger.info("Total dogs scraped from all sources: %d", len(all_dogs))
-        unique_dogs = self._deduplicate_dogs(all_dogs)
-        self._score_dogs_concurrently(unique_dogs)
-        unique_dogs.sort(key=lambda x: x.get("score", 0), reverse=True)
-        self.logger.info("Total unique dogs from all sources: %d", len(unique_dogs))
-        return unique_dogs
+        return all_dogs
+
+    def _release_scrape_resources(self):
+        self.browser_pool.close()
+        # Page bodies are only reused within a run; free them until the next one
+        with self._page_cache_lock:
+            self._page_cache.clear()
+        # Descriptions fetched while scraping are written once, not per page
+        self._save_cache()
+
+    def _score_new_dogs(self, dogs: List[Dict]):
+        """Score dogs missing from the seen index; the others get their stored score."""
+        new_dogs, known_dogs = self.partition_known_dogs(dogs)
+        self.logger.info(
+            "Reusing %d known scores, scoring %d new dogs",
+            len(known_dogs),
+            len(new_dogs),
+        )
+        self._score_dogs_concurrently(new_dogs)
+        self.update_seen_index(new_dogs)
+        # Scoring may have fetched missing descriptions too
+        self._save_cache()
 
     def _deduplicate_dogs(self, dogs: List[Dict]) -> List[Dict]:
-        unique_dogs: List[Dict] = []
-        seen_dogs = set()
-        for dog in dogs:
-            dog_key = (dog.get("name", "").lower(), dog.get("detail_url", ""))
-            if dog_key not in seen_dogs:
-                seen_dogs.add(dog_key)
-                unique_dogs.append(dog)
-        return unique_dogs
+        # Keys keep first-seen order; a duplicate's later record replaces the earlier one
+        unique = {
+            (dog.get("name", "").lower(), dog.get("detail_url", "")): dog
+            for dog in dogs
+        }
+        return list(unique.values())
 
     def _score_dogs_concurrently(self, dogs: List[Dict]):
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            future_to_dog = {
-                executor.submit(self.score_dog_with_gemini, dog): dog for dog in dogs
-            }
-            for future in as_completed(future_to_dog):
-                dog = future_to_dog[future]
-                try:
-                    scoring_result = future.result()
-                    dog.update(scoring_result)
-                except Exception as exc:
-                    self.logger.error(
-                        f"Dog {dog.get('name')} generated an exception during scoring: {exc}"
-                    )
-                    dog["score"] = -1
-                    dog["score_details"] = ["Scoring failed"]
+        batches = [dogs[i : i + BATCH_SIZE] for i in range(0, len(dogs), BATCH_SIZE)]
+        if batches:
+            self._scoring_loop.run_until_complete(self._score_batches(batches))
+
+    async def _score_batches(self, batches: List[List[Dict]]):
+        semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self.score_dogs_batch_async(batch, semaphore) for batch in batches),
+            return_exceptions=True,
+        )
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Batch scoring generated an exception: {result}")
+                # Dogs scored from the cache before the failure keep their score
+                for dog in batch:
+                    if "score" not in dog:
+                        dog["score"] = -1
+                        dog["score_details"] = ["Scoring failed"]
 
     def start_scheduler(self):
-        schedule.every().day.at("09:00").do(self.run_daily_scrape)
+        """Run run_daily_scrape every day at DAILY_SCRAPE_HOUR on a background thread."""
+        if self._scheduler_thread is not None:
+            return
+        self._scheduler_thread = threading.Thread(
+            target=self._run_scheduler, name="daily_scrape"
+        )
+        self._scheduler_thread.start()
+
+    def _run_scheduler(self):
+        # Sleeps until the next run instead of polling for pending jobs
+        while True:
+            time.sleep(self._seconds_until_next_scrape())
+            try:
+                self.run_daily_scrape()
+            except Exception as e:
+                self.logger.error(f"Daily scrape failed: {e}")
+
+    @staticmethod
+    def _seconds_until_next_scrape() -> float:
+        now = datetime.now()
+        next_run = now.replace(
+            hour=DAILY_SCRAPE_HOUR, minute=0, second=0, microsecond=0
+        )
+        if next_run <= now:
+            next_run += timedelta(days=1)
+        return (next_run - now).total_seconds()
 
     def run_daily_scrape(self):
         self.logger.info("Starting daily dog scraping job")
         dogs = self.scrape_all_sources()
         if dogs:
-            for dog in dogs:
-                dogs.sort(key=lambda x: x.get("score", 0), reverse=True)
+            # scrape_all_sources already returns dogs sorted by score
             self.save_data(dogs)
-            print(f"\n🐕 FOUND {len(dogs)} DOGS IN PARIS REGION")
-            print("📊 Ranked by apartment suitability & cat compatibility:")
-            print("━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━")
-            excellent_dogs = [dog for dog in dogs if dog.get("score", 0) >= 50][:20]
-            if not excellent_dogs:
-                print("\nNo dogs scored 80 or higher in this run.")
-            for i, dog in enumerate(excellent_dogs, 1):
-                score = dog.get("score", 0)
-                name = dog.get("name", "Unknown")
-                score_indicator = "🟢 EXCELLENT"
-                print(f"\n{i}. {name} - {score_indicator} ({score}/100)")
-                print(f"   Score breakdown: {', '.join(dog.get('score_details', []))}")
-                print(f"   🔗 {dog.get('detail_url', 'No URL')}")
-                # Image URLs are not displayed
+            print(self._format_top_dogs(dogs))
         else:
             print("\n⚠️  No dogs found")
             print("💡 Try checking the site manually or expand search to other regions")
@@ -138,6 +208,31 @@ class DogAdoptionBot(
         except Exception:
             pass
 
+    def _format_top_dogs(self, dogs: List[Dict]) -> str:
+        # Built up and written once rather than one print per line
+        lines = [
+            f"\n🐕 FOUND {len(dogs)} DOGS IN PARIS REGION",
+            "📊 Ranked by apartment suitability & cat compatibility:",
+            "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+        ]
+        # dogs is sorted, so the first 20 at or above 50 are the top ones
+        excellent_dogs = list(
+            islice((dog for dog in dogs if dog.get("score", 0) >= 50), 20)
+        )
+        if not excellent_dogs:
+            lines.append("\nNo dogs scored 80 or higher in this run.")
+        for i, dog in enumerate(excellent_dogs, 1):
+            score = dog.get("score", 0)
+            name = dog.get("name", "Unknown")
+            score_indicator = "🟢 EXCELLENT"
+            lines.append(f"\n{i}. {name} - {score_indicator} ({score}/100)")
+            lines.append(
+                f"   Score breakdown: {', '.join(dog.get('score_details', []))}"
+            )
+            lines.append(f"   🔗 {dog.get('detail_url', 'No URL')}")
+            # Image URLs are not displayed
+        return "\n".join(lines)
+
 
 def main():
     bot = DogAdoptionBot()
@@ -1,14 +1,13 @@
-import time
-from datetime import datetime
 from typing import Dict, List, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 
 class RememberMeMixin:
     def scrape_rememberme(self) -> List[Dict]:
         self.logger.info("Scraping from remembermefrance.org")
         all_dogs: List[Dict] = []
+        articles: List[BeautifulSoup] = []
         base_url = "https://remembermefrance.org/pets/?breed=chiot&pets_search%5Bsexe%5D=all&pets_search%5Bou_est_le_chien%5D=En+Roumanie&pets_search%5Burgence%5D=all"
         page = 1
         while True:
@@ -16,21 +15,23 @@ class RememberMeMixin:
             url = f"{base_url}&_page={page}"
             if page > 1:
                 url = f"https://remembermefrance.org/pets/page/{page}/?breed=chiot&pets_search%5Bsexe%5D=all&pets_search%5Bou_est_le_chien%5D=En+Roumanie&pets_search%5Burgence%5D=all"
-            soup = self.get_page(url)
+            # Listing cards and the next-page link are all the loop reads
+            soup = self.get_page(url, strainer=SoupStrainer(["article", "a"]))
             if not soup:
                 break
             dog_articles = soup.find_all("article", class_="pets")
             if not dog_articles:
                 break
-            for article in dog_articles:
-                dog_info = self.extract_dog_info_rememberme(article)
-                if dog_info:
-                    all_dogs.append(dog_info)
+            articles.extend(dog_articles)
             next_link = soup.find("a", class_="next page-numbers")
             if not next_link:
                 break
             page += 1
-            time.sleep(1)
+        # Detail pages are independent; max_workers caps the load on the host
+        results = self.map_concurrently(
+            self.extract_dog_info_rememberme, articles, max_workers=10
+        )
+        all_dogs.extend(dog_info for dog_info in results if dog_info)
         return all_dogs
 
     def extract_dog_info_rememberme(
@@ -76,7 +77,7 @@ class RememberMeMixin:
                 "name": name,
                 "detail_url": detail_url,
                 "full_description": full_description,
-                "scraped_date": datetime.now().isoformat(),
+                "scraped_date": self._run_timestamp,
                 "source": "remembermefrance.org",
             }
         except Exception as e:
@@ -1,9 +1,14 @@
-from datetime import datetime
 from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+# Description containers seen on detail pages, first match in document order wins
+DESCRIPTION_SELECTOR = (
+    ".description, .desc, .annonce-description, .annonce-txt, .ad-description, "
+    ".entry-content, #description, .post-content, .ad-detail__description, .content"
+)
+
 
 class ReseauAdoptionMixin:
     def scrape_reseauadoption(self) -> List[Dict]:
@@ -107,7 +112,7 @@ class ReseauAdoptionMixin:
                 "detail_url": "",
                 "full_description": "",
                 # image_url removed
-                "scraped_date": datetime.now().isoformat(),
+                "scraped_date": self._run_timestamp,
                 "source": "reseau-adoption.fr",
             }
 
@@ -132,7 +137,7 @@ class ReseauAdoptionMixin:
             if dog_info["name"] == "Unknown":
                 text = element.get_text(strip=True)
                 if text and len(text) > 1:
-                    first_line = text.split("\n")[0].strip()
+                    first_line = text.partition("\n")[0].strip()
                     if first_line:
                         dog_info["name"] = first_line[:60]
 
@@ -164,25 +169,10 @@ class ReseauAdoptionMixin:
                     detail_soup = self.get_page(dog_info["detail_url"])
                     if detail_soup:
                         # Prefer specific description containers if present
-                        desc_selectors = [
-                            ".description",
-                            ".desc",
-                            ".annonce-description",
-                            ".annonce-txt",
-                            ".ad-description",
-                            ".entry-content",
-                            "#description",
-                            ".post-content",
-                            ".ad-detail__description",
-                            ".content",
-                        ]
-                        best_desc = ""
-                        for sel in desc_selectors:
-                            node = detail_soup.select_one(sel)
-                            if node:
-                                txt = node.get_text(separator="\n", strip=True)
-                                if txt and len(txt) > len(best_desc):
-                                    best_desc = txt
+                        node = detail_soup.select_one(DESCRIPTION_SELECTOR)
+                        best_desc = (
+                            node.get_text(separator="\n", strip=True) if node else ""
+                        )
 
                         # Fallback to paragraphs under main/content area
                         if not best_desc:
@@ -0,0 +1,212 @@
+import asyncio
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Dict, List, Optional
+
+try:  # Package context
+    from .core import DEFAULT_PROMPT_TEMPLATE, DESCRIPTION_MAX_LENGTH
+except ImportError:  # Direct script context
+    from core import DEFAULT_PROMPT_TEMPLATE, DESCRIPTION_MAX_LENGTH
+
+# Descriptions shorter than this cannot yield a meaningful Gemini score
+MIN_DESCRIPTION_LENGTH = 100
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.S)
+# Scores cached by description text expire after a week
+SCORE_CACHE_TTL = 7 * 24 * 3600
+BATCH_SIZE = 10
+# Leads the score_details of every score Gemini produced
+GEMINI_SCORE_PREFIX = "Gemini Score: "
+# Batch prompts in flight at once
+GEMINI_CONCURRENCY = 4
+BATCH_INSTRUCTIONS = (
+    "\n\nScore every dog listed above independently. Return only a JSON array "
+    'with one object per dog: [{"id": <ID>, "score": <integer 0-100>}].'
+)
+
+
+class ScoringMixin:
+    def _score_without_gemini(self, dog_info: Dict) -> Optional[Dict]:
+        """Return a score when no Gemini call is needed, else None."""
+        detail_url = dog_info.get("detail_url", "")
+        full_desc = self._resolve_description(dog_info)
+        if not full_desc:
+            self.logger.info(
+                f"Skipping Gemini for {dog_info.get('name', 'Unknown')} due to missing description"
+            )
+            return {"score": -1, "score_details": ["Missing description"]}
+        if len(full_desc.strip()) < MIN_DESCRIPTION_LENGTH:
+            return {"score": 0, "score_details": ["Insufficient description"]}
+        cached = self._get_cached_result(dog_info)
+        if cached is not None:
+            return cached
+        # Checked after the caches: cache-hit scrapes may not recover the name
+        if dog_info.get("name") == "Unknown":
+            return {"score": 0, "score_details": ["Unknown dog name"]}
+        # If we have a cached description but no cached score for this prompt, warn
+        if detail_url and self.get_cached_description(detail_url):
+            self.logger.warning(
+                f"Cached description found for {detail_url} but no cached score for current prompt (hash={self._prompt_hash}). Gemini will be called."
+            )
+        return None
+
+    def _get_cached_result(self, dog_info: Dict) -> Optional[Dict]:
+        # Same listing first, then the same text under any URL (e.g. reposted)
+        for key, max_age in (
+            (dog_info.get("detail_url", ""), None),
+            (self._description_key(dog_info), SCORE_CACHE_TTL),
+        ):
+            cached = self.get_cached_score(key, self._prompt_hash, max_age=max_age)
+            if cached is not None:
+                self.logger.debug(f"cache hit for {key}")
+                return {
+                    "score": cached["score"],
+                    "score_details": cached["score_details"],
+                }
+        return None
+
+    def _description_key(self, dog_info: Dict) -> str:
+        text = dog_info.get("full_description", "")[:DESCRIPTION_MAX_LENGTH]
+        return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _store_score(
+        self, dog_info: Dict, score: int, score_details: List[str]
+    ) -> None:
+        prompt_hash = self._prompt_hash
+        for key in (
+            dog_info.get("detail_url", ""),
+            self._description_key(dog_info),
+        ):
+            self.set_cached_score(key, prompt_hash, score, score_details, save=False)
+
+    def _prune_description_scores(self) -> None:
+        """Drop description-keyed scores once SCORE_CACHE_TTL makes them unusable."""
+        cutoff = time.time() - SCORE_CACHE_TTL
+        with self.cache_lock:
+            scores = self.cache.get("scores", {})
+            for key in [k for k in scores if k.startswith("sha256:")]:
+                by_prompt = {
+                    h: entry
+                    for h, entry in scores[key].items()
+                    if entry.get("updated_at", 0) >= cutoff
+                }
+                if by_prompt:
+                    scores[key] = by_prompt
+                else:
+                    del scores[key]
+
+    def _resolve_description(self, dog_info: Dict) -> str:
+        # Not re-cached here: scrapers cache the detail pages they fetch, and
+        # a listing excerpt must not stand in for the detail description
+        detail_url = dog_info.get("detail_url", "")
+        full_desc = dog_info.get("full_description") or self.get_cached_description(
+            detail_url
+        )
+        if not full_desc and detail_url:
+            # get_full_description caches what it fetches
+            full_desc = self.get_full_description(detail_url)
+            if full_desc:
+                dog_info["full_description"] = full_desc
+        return full_desc
+
+    def _get_gemini_model(self):
+        with self._gemini_lock:
+            if self._gemini_model is None:
+                import google.generativeai as genai
+
+                api_key = os.environ.get("API_KEY")
+                if not api_key:
+                    self.logger.error("API_KEY environment variable not set.")
+                    return None
+                genai.configure(api_key=api_key)
+                self._gemini_model = genai.GenerativeModel("gemini-1.5-flash")
+            return self._gemini_model
+
+    # ---------------
+    # Batch scoring
+    # ---------------
+    async def score_dogs_batch_async(
+        self, dogs: List[Dict], semaphore: asyncio.Semaphore
+    ) -> None:
+        """Score dogs in place, sending all that need Gemini in a single prompt."""
+        # Cache lookups may fetch a missing description over plain HTTP
+        pending = await asyncio.to_thread(self._score_batch_without_gemini, dogs)
+        model = self._get_batch_model(pending)
+        if model is None:
+            return
+        async with semaphore:
+            response = await model.generate_content_async(
+                self._generate_batch_prompt(pending)
+            )
+        self._apply_batch_scores(pending, self._response_text(response))
+
+    def _score_batch_without_gemini(self, dogs: List[Dict]) -> List[Dict]:
+        """Score what the cache can, returning the dogs still needing Gemini."""
+        pending: List[Dict] = []
+        for dog in dogs:
+            early_result = self._score_without_gemini(dog)
+            if early_result is not None:
+                dog.update(early_result)
+            else:
+                pending.append(dog)
+        return pending
+
+    def _get_batch_model(self, pending: List[Dict]):
+        if not pending:
+            return None
+        model = self._get_gemini_model()
+        if model is None:
+            for dog in pending:
+                dog.update({"score": 0, "score_details": ["Missing API Key"]})
+        return model
+
+    def _apply_batch_scores(self, pending: List[Dict], response_text: str) -> None:
+        scores = self._parse_batch_scores(response_text)
+        for i, dog in enumerate(pending):
+            if i not in scores:
+                dog.update({"score": -1, "score_details": ["Missing from batch"]})
+                continue
+            dog["score"] = scores[i]
+            dog["score_details"] = [f"{GEMINI_SCORE_PREFIX}{scores[i]}/100"]
+            self._store_score(dog, scores[i], dog["score_details"])
+        if scores:
+            # One cache write per batch rather than two per dog
+            self._prune_description_scores()
+            self._save_cache()
+
+    def is_gemini_score(self, dog: Dict) -> bool:
+        """True if dog's score came from Gemini rather than a placeholder."""
+        details = dog.get("score_details") or [""]
+        return details[0].startswith(GEMINI_SCORE_PREFIX)
+
+    def _response_text(self, response) -> str:
+        # .text raises ValueError when every candidate was blocked or empty
+        try:
+            return response.text
+        except ValueError as e:
+            self.logger.warning(f"Gemini returned no text: {e}")
+            return ""
+
+    def _generate_batch_prompt(self, dogs: List[Dict]) -> str:
+        dogs_text = "\n---\n".join(
+            f"ID={i} NAME={dog.get('name', 'Unknown')}\n{dog['full_description'][:DESCRIPTION_MAX_LENGTH]}"
+            for i, dog in enumerate(dogs)
+        )
+        prompt_template = self._prompt_template
+        if prompt_template is None:
+            prompt_template = DEFAULT_PROMPT_TEMPLATE
+        prompt = prompt_template.replace("{dog_name}", "each dog listed below")
+        return prompt.replace("{raw_text}", dogs_text) + BATCH_INSTRUCTIONS
+
+    def _parse_batch_scores(self, response_text: str) -> Dict[int, int]:
+        match = _JSON_ARRAY_RE.search(response_text)
+        try:
+            items = json.loads(match.group()) if match else []
+            return {
+                int(item["id"]): max(0, min(100, int(item["score"]))) for item in items
+            }
+        except (ValueError, TypeError, KeyError) as e:
+            self.logger.warning(f"Could not parse batch scores from Gemini: {e}")
+            return {}
@@ -1,34 +1,39 @@
+import functools
+import re
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+# Listing/navigation pages that link under /animal/ without being a dog
+_SKIP_HREF_RE = re.compile(
+    "adopter-un-chien|adopter-un-chat|ils-ont-ete-adoptes|perles-noires"
+    "|seniors-en-or|pourquoi-pas-moi|urgences|coup-de-coeur|voir-plus|exclure"
+)
+# Substrings in a link's text that mark it as a dog card
+_DOG_INDICATOR_RE = re.compile(
+    "mâle|femelle|ans|chien|bouledogue anglais|carlin|shih tzu"
+    "|cavalier king charles|bichon havanais|bichon frisé|lhasa apso"
+    "|boston terrier|petit brabançon",
+    re.IGNORECASE,
+)
+
 
 class SecondeChanceMixin:
-    def build_filtered_url(self, broader_search: bool = False) -> str:
-        base_url = f"{self.base_url}/animal/adopter-un-chien"
-        params = [
-            "species=1",
-        ]
-        if broader_search:
-            for region in self.search_regions:
-                params.append(f"regions[]={region}")
-            self.logger.info("Using broader search across multiple regions")
-        else:
-            params.append("region=2")
-            for dept in self.paris_departments:
-                params.append(f"departments[]={dept}")
-        filtered_url = f"{base_url}?{'&'.join(params)}"
-        self.logger.info(f"Using filtered URL: {filtered_url}")
-        return filtered_url
+    @functools.cached_property
+    def filtered_url(self) -> str:
+        """Adoption search restricted to the Paris-area departments."""
+        params = ["species=1", "region=2"]
+        params.extend(f"departments[]={dept}" for dept in self.paris_departments)
+        return f"{self.base_url}/animal/adopter-un-chien?{'&'.join(params)}"
 
     def scrape_secondechance(self) -> List[Dict]:
         all_dogs: List[Dict] = []
-        filtered_url = self.build_filtered_url()
         visited_urls = set()
-        urls_to_visit = [filtered_url]
+        urls_to_visit = deque([self.filtered_url])
         while urls_to_visit:
-            current_url = urls_to_visit.pop(0)
+            current_url = urls_to_visit.popleft()
             if current_url in visited_urls:
                 continue
             visited_urls.add(current_url)
@@ -54,114 +59,93 @@ class SecondeChanceMixin:
         dogs: List[Dict] = []
         dog_links: List[str] = []
         all_links = soup.find_all("a", href=True)
-        skip_tokens = [
-            "adopter-un-chien",
-            "adopter-un-chat",
-            "ils-ont-ete-adoptes",
-            "perles-noires",
-            "seniors-en-or",
-            "pourquoi-pas-moi",
-            "urgences",
-            "coup-de-coeur",
-            "voir-plus",
-            "exclure",
-        ]
-        indicators = [
-            "mâle",
-            "femelle",
-            "ans",
-            "chien",
-            "chienne",
-            "bouledogue anglais",
-            "carlin",
-            "shih tzu",
-            "cavalier king charles",
-            "bichon havanais",
-            "bichon frisé",
-            "lhasa apso",
-            "boston terrier",
-            "petit brabançon",
-        ]
         for link in all_links:
             href = link.get("href", "")
-            if "/animal/" not in href:
-                continue
-            if any(skip in href for skip in skip_tokens):
+            if "/animal/" not in href or _SKIP_HREF_RE.search(href):
                 continue
-            link_text = link.get_text().strip()
-            if not any(ind in link_text.lower() for ind in indicators):
+            if not _DOG_INDICATOR_RE.search(link.get_text()):
                 continue
             if not href.startswith("http"):
                 href = f"{self.base_url}{href}"
             dog_links.append(href)
         self.logger.info(f"Found {len(dog_links)} potential dog pages")
-        for dog_url in dog_links:
-            # First consult cache to avoid re-downloading
-            cached_desc = self.get_cached_description(dog_url)
-            cached_name = self.get_cached_name(dog_url)
-            if cached_desc:
-                dogs.append(
-                    {
-                        "name": cached_name or "Unknown",
-                        "full_description": cached_desc,
-                        "detail_url": dog_url,
-                    }
-                )
-                # record cache hit
-                try:
-                    self.stats_inc("secondechance", True)
-                except Exception:
-                    pass
-                continue
-            dog_soup = self.get_page(dog_url)
-            if not dog_soup:
-                continue
-            title = dog_soup.find("title")
-            name = title.get_text().strip() if title else "Unknown"
-            content = dog_soup.get_text()
-            self.set_cached_description(dog_url, content, name=name)
-            try:
-                self.stats_inc("secondechance", False)
-            except Exception:
-                pass
-            dog_info = {
-                "name": name.split("-")[0].strip() if "-" in name else name,
-                "full_description": content,
-                "detail_url": dog_url,
-            }
-            if dog_info["name"]:
-                dogs.append(dog_info)
+        results = self.map_concurrently(self._scrape_secondechance_dog, dog_links)
+        dogs.extend(dog_info for dog_info in results if dog_info)
         if not dogs:
             elements = soup.select("div.p-6.w-full")
             if elements:
                 self.logger.info(
                     f"Found {len(elements)} dog elements with old selector"
                 )
-                for element in elements:
-                    dog_info = self.extract_dog_info(element)
-                    if dog_info["name"]:
-                        if dog_info["detail_url"]:
-                            cached = self.get_cached_description(dog_info["detail_url"])
-                            if cached:
-                                dog_info["full_description"] = cached
-                                try:
-                                    self.stats_inc("secondechance", True)
-                                except Exception:
-                                    pass
-                            else:
-                                full_desc = self.get_full_description(
-                                    dog_info["detail_url"]
-                                )
-                                if full_desc:
-                                    dog_info["full_description"] = full_desc
-                                    try:
-                                        self.stats_inc("secondechance", False)
-                                    except Exception:
-                                        pass
-                        dogs.append(dog_info)
+                results = self.map_concurrently(
+                    self._scrape_secondechance_element, elements
+                )
+                dogs.extend(dog_info for dog_info in results if dog_info)
         self.logger.info(f"Scraped {len(dogs)} dogs from {url}")
         return dogs, soup
 
+    def _scrape_secondechance_element(self, element) -> Optional[Dict]:
+        """Build a dog from a legacy listing card, completing its description."""
+        dog_info = self.extract_dog_info(element)
+        if not dog_info["name"]:
+            return None
+        if dog_info["detail_url"]:
+            cached = self.get_cached_description(dog_info["detail_url"])
+            if cached:
+                dog_info["full_description"] = cached
+                try:
+                    self.stats_inc("secondechance", True)
+                except Exception:
+                    pass
+            else:
+                full_desc = self.get_full_description(dog_info["detail_url"])
+                if full_desc:
+                    dog_info["full_description"] = full_desc
+                    try:
+                        self.stats_inc("secondechance", False)
+                    except Exception:
+                        pass
+        return dog_info
+
+    def _scrape_secondechance_dog(self, dog_url: str) -> Optional[Dict]:
+        # First consult cache to avoid re-downloading
+        cached = self._get_cached_secondechance_dog(dog_url)
+        if cached:
+            return cached
+        dog_soup = self.get_page(dog_url)
+        if not dog_soup:
+            return None
+        title = dog_soup.find("title")
+        name = title.get_text().strip() if title else "Unknown"
+        # Only the description sections, not the navigation and footer text
+        content = self._extract_sections(dog_soup) or self.extract_main_text(dog_soup)
+        self.set_cached_description(dog_url, content, name=name)
+        try:
+            self.stats_inc("secondechance", False)
+        except Exception:
+            pass
+        dog_info = {
+            "name": name.split("-")[0].strip() if "-" in name else name,
+            "full_description": content,
+            "detail_url": dog_url,
+        }
+        return dog_info if dog_info["name"] else None
+
+    def _get_cached_secondechance_dog(self, dog_url: str) -> Optional[Dict]:
+        cached_desc = self.get_cached_description(dog_url)
+        if not cached_desc:
+            return None
+        # record cache hit
+        try:
+            self.stats_inc("secondechance", True)
+        except Exception:
+            pass
+        return {
+            "name": self.get_cached_name(dog_url) or "Unknown",
+            "full_description": cached_desc,
+            "detail_url": dog_url,
+        }
+
     def find_pagination_urls(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         pagination_urls: List[str] = []
         pagination_divs = soup.select("div.pagination")
@@ -0,0 +1,77 @@
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+
+# Entries older than this are rescored on the next run
+SEEN_INDEX_MAX_AGE = 30 * 24 * 3600
+
+
+class SeenIndexMixin:
+    """Persist scores of already-seen dogs so daily runs only score new listings."""
+
+    def _seen_index_path(self) -> str:
+        return os.path.join(self.data_dir, "seen_index.json")
+
+    def load_seen_index(self) -> Dict:
+        try:
+            with open(self._seen_index_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Failed to load seen index: {e}")
+            return {}
+
+    def partition_known_dogs(self, dogs: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Split dogs into (new, known); known dogs get their stored score back.
+
+        Only scores given under the current prompt count as known.
+        """
+        cutoff = time.time() - SEEN_INDEX_MAX_AGE
+        new_dogs: List[Dict] = []
+        known_dogs: List[Dict] = []
+        for dog in dogs:
+            entry = self._seen_index.get(dog.get("detail_url", ""))
+            if (
+                entry
+                and entry.get("ts", 0) >= cutoff
+                and entry.get("prompt_hash") == self._prompt_hash
+            ):
+                dog["score"] = entry["score"]
+                dog["score_details"] = entry.get("score_details", [])
+                known_dogs.append(dog)
+            else:
+                new_dogs.append(dog)
+        return new_dogs, known_dogs
+
+    def update_seen_index(self, scored_dogs: List[Dict]) -> None:
+        now = int(time.time())
+        for dog in scored_dogs:
+            url = dog.get("detail_url")
+            # Placeholders such as "Missing API Key" must not stick for a month
+            if not url or not self.is_gemini_score(dog):
+                continue
+            self._seen_index[url] = {
+                "score": dog["score"],
+                "score_details": dog.get("score_details", []),
+                "prompt_hash": self._prompt_hash,
+                "ts": now,
+            }
+        cutoff = now - SEEN_INDEX_MAX_AGE
+        self._seen_index = {
+            url: entry
+            for url, entry in self._seen_index.items()
+            if entry.get("ts", 0) >= cutoff
+        }
+        self._save_seen_index()
+
+    def _save_seen_index(self) -> None:
+        path = self._seen_index_path()
+        try:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._seen_index, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Failed to save seen index: {e}")